@@ -1,8 +1,11 @@
 # Import the Tkinter library, which is built-in with Python for GUI development.
 import tkinter as tk
-# Add time for tracking duration and datetime for formatting the time delta
-import time 
-from datetime import timedelta
+# sys is used to intern the theme color strings (cheap Python->Tcl conversion).
+import sys
+# Add time for tracking the session duration
+import time
+# Pickle is used to persist the task lists between sessions.
+import pickle
 # Import specific modules from Tkinter for dialog boxes (simple input/output) and ttk for scrollbar and Combobox.
 from tkinter import simpledialog, messagebox, ttk 
 
@@ -32,8 +35,41 @@ THEMES = {
         "done_fg": "#A0A0A0",
     }
 }
+
+# Intern every theme color string once. The same few color values are passed
+# to Tcl over and over from the row-configure hot path; interned strings let
+# the converter reuse one cached object per value instead of copying each time.
+for _theme_colors in THEMES.values():
+    for _color_key, _color_value in _theme_colors.items():
+        _theme_colors[_color_key] = sys.intern(_color_value)
+del _theme_colors, _color_key, _color_value
+
 # Global variable to hold the currently selected theme's color dictionary.
 current_theme = THEMES["Calm (Mint & Yellow)"] # Set initial theme
+
+# Resolved per-status row styles for the active theme, keyed by the done flag:
+# status -> (label Tcl configure options, row background). The options are
+# stored as a preformatted flag/value tuple so the hot reconfigure path can
+# hand them straight to tk.call without rebuilding anything per row.
+_resolved_styles = {}
+
+def _resolve_theme_styles():
+    """Precomputes the row style Tcl options for each task status."""
+    _resolved_styles[True] = (
+        ('-font', ("Arial", 12, "overstrike"),
+         '-fg', current_theme['done_fg'],
+         '-bg', current_theme['done_bg']),
+        current_theme['done_bg'],
+    )
+    _resolved_styles[False] = (
+        ('-font', ("Arial", 12),
+         '-fg', current_theme['default_fg'],
+         '-bg', current_theme['list_bg']),
+        current_theme['list_bg'],
+    )
+
+# Resolve the styles for the initial theme at import time.
+_resolve_theme_styles()
 # Global reference to the main root window
 root = None 
 # Global references to key widgets for reconfiguration
@@ -49,74 +85,180 @@ exit_button = None # Added for global access
 theme_selector = None # Added for global access
 stats_label = None # New label for displaying stats
 # NEW: Global variable to track the maximum number of tasks ever added during the session
-max_tasks_ever_added = 0 
+max_tasks_ever_added = 0
+# Rows currently materialized inside the viewport: index -> (Label, Button).
+# Off-screen rows have no widgets at all; scrolling creates/destroys them on demand.
+live_rows = {}
+# Fixed pixel height of one task row, measured once from a sample widget.
+_row_height = None
+# Number of leading grid rows currently reserved with the fixed row height.
+_sized_rows = 0
+# Free list of (Label, Button) row widgets that scrolled out
+# of view, kept un-gridded for reuse instead of being destroyed.
+_row_pool = []
+# Canvas item id of the embedded task_frame window (set in main), used to hide
+# the frame while a batch of rows is gridded.
+_canvas_window = None
 
 
 # --- Data Structure and Backend Logic ---
 
-# Initialize the core data structure: a global list to hold all tasks.
-# Each task is now stored as a tuple: (desc, status, creation_time, completion_time).
-todo_list = []
+# Initialize the core data structure: four parallel lists (structure-of-arrays),
+# one per task field. Hot paths then only touch the single list they need
+# instead of unpacking (desc, status, creation_time, completion_time) tuples.
+descs = []            # Task description strings
+statuses = []         # Completion status booleans
+creation_times = []   # time.time() when the task was added
+completion_times = [] # time.time() when marked done, or None while pending
+
+# Creation time of the very first task of the session, cached so the duration
+# display never has to look at the task lists (and survives deleting all tasks).
+_session_start_time = None
+
+# Running count of completed tasks, kept in sync by toggle/delete so the stats
+# line never has to rescan the status list.
+_completed_count = 0
+
+# File the task lists are persisted to between sessions.
+TASKS_FILE = "tasks.dat"
+# Pending root.after token for the debounced save, or None.
+_save_after_id = None
+
+def _load_tasks():
+    """Restores the task lists from TASKS_FILE, if a previous session saved one."""
+    global _completed_count, _session_start_time
+    try:
+        with open(TASKS_FILE, 'rb') as f:
+            loaded = pickle.load(f)
+        descs[:], statuses[:], creation_times[:], completion_times[:] = loaded
+    except (OSError, pickle.PickleError, ValueError, EOFError):
+        # Missing or unreadable file: start the session with an empty list.
+        return
+    # Rebuild the derived state for the restored tasks.
+    _completed_count = sum(statuses)
+    if creation_times:
+        _session_start_time = creation_times[0]
+
+def _save_tasks():
+    """Writes the four task lists to TASKS_FILE in one pickle dump."""
+    global _save_after_id
+    _save_after_id = None
+    try:
+        with open(TASKS_FILE, 'wb') as f:
+            pickle.dump((descs, statuses, creation_times, completion_times), f)
+    except OSError:
+        # Persistence is best-effort; never let a failed save break the UI.
+        pass
+
+def _schedule_save():
+    """Debounces disk writes: a burst of edits results in a single save."""
+    global _save_after_id
+    if root is None:
+        return
+    if _save_after_id is not None:
+        root.after_cancel(_save_after_id)
+    _save_after_id = root.after(500, _save_tasks)
+
+# True while a display refresh is already queued on the event loop.
+_refresh_pending = False
+
+def request_display_refresh():
+    """Schedules one display refresh for all mutations in the current event cycle.
+
+    Multiple adds/deletes arriving before the event loop goes idle collapse
+    into a single update_task_list_display call."""
+    global _refresh_pending
+    if root is None:
+        # No event loop yet (e.g. during startup); refresh synchronously.
+        update_task_list_display()
+    elif not _refresh_pending:
+        _refresh_pending = True
+        root.after_idle(_run_scheduled_refresh)
+
+def _run_scheduled_refresh():
+    """Clears the pending flag and performs the queued display refresh."""
+    global _refresh_pending
+    _refresh_pending = False
+    update_task_list_display()
 
-# Function to add a task to the global list.
+# Function to add a task to the global lists.
 def add_task_logic(task_desc):
-    """Adds a task to the global list and triggers a GUI update."""
-    global max_tasks_ever_added
-    # Append a new tuple: (desc, status=False, creation_time=now, completion_time=None)
-    todo_list.append((task_desc, False, time.time(), None))
+    """Adds a task to the global lists and triggers a GUI update."""
+    global max_tasks_ever_added, _session_start_time
+    # Append the new task's fields: status=False, creation_time=now, completion_time=None
+    descs.append(task_desc)
+    statuses.append(False)
+    creation_times.append(time.time())
+    completion_times.append(None)
+    # Remember when the session's first task was created.
+    if _session_start_time is None:
+        _session_start_time = creation_times[0]
     # NEW: Update max tasks ever added during the session
-    max_tasks_ever_added = max(max_tasks_ever_added, len(todo_list)) 
-    # Call the GUI function to refresh the task list display.
-    update_task_list_display()
-    # update_stats() is now managed by the root.after loop.
+    max_tasks_ever_added = max(max_tasks_ever_added, len(descs))
+    # Queue a display refresh (bursts of adds collapse into one rebuild).
+    request_display_refresh()
+    # Refresh the completed/total counts (event-driven, no polling needed).
+    update_completed_stats()
+    # Persist the change (debounced).
+    _schedule_save()
 
 # Function called when a checkbox is toggled.
 def toggle_task_status(index):
     """Flips the status of a task at a given index and updates its completion time."""
+    global _completed_count
     # Check if the provided index is valid (within the bounds of the list).
-    if 0 <= index < len(todo_list):
-        # Unpack the existing tuple, including time stamps.
-        task_desc, current_status, creation_time, completion_time = todo_list[index]
-        
-        new_status = not current_status
-        new_completion_time = None
-        
-        if new_status:
-            # Mark done: record current time as the completion time.
-            new_completion_time = time.time()
-        
-        # Overwrite the old tuple with a new one, flipping the boolean status and updating the time.
-        todo_list[index] = (task_desc, new_status, creation_time, new_completion_time)
-        
-        # Call the update function to re-render the list. Stats will update in the next 1-second cycle.
-        update_task_list_display() 
+    if 0 <= index < len(descs):
+        # Flip the boolean status in place and stamp/clear the completion time.
+        statuses[index] = not statuses[index]
+        completion_times[index] = time.time() if statuses[index] else None
+        # Keep the running completed counter in sync.
+        _completed_count += 1 if statuses[index] else -1
+
+        # Patch only the toggled row in place and refresh the completed count.
+        update_task_list_display(changed_index=index)
+        update_completed_stats()
+        # Persist the change (debounced).
+        _schedule_save()
 
 # Function to delete a task based on its index.
 def delete_task_logic(index):
     """Deletes a task at a given index and triggers a GUI update."""
+    global _completed_count
     # Check if the provided index is valid.
-    if 0 <= index < len(todo_list):
+    if 0 <= index < len(descs):
         # Use a custom colored confirmation dialog before deleting.
-        message = f"Are you sure you want to delete task '{todo_list[index][0]}'?"
+        message = f"Are you sure you want to delete task '{descs[index]}'?"
         # The custom dialog is called, returning True if 'Yes' is clicked.
         if custom_ask_yes_no(root, "Confirm Delete", message):
-            # Use the pop() method to remove the item at the specific index.
-            todo_list.pop(index)
-            # Call the GUI function to refresh the task list display.
-            update_task_list_display()
+            # Deleting a completed task lowers the running completed counter.
+            if statuses[index]:
+                _completed_count -= 1
+            # Use the pop() method to remove the item from all four lists.
+            descs.pop(index)
+            statuses.pop(index)
+            creation_times.pop(index)
+            completion_times.pop(index)
+            # Queue a display refresh (bursts of deletes collapse into one rebuild).
+            request_display_refresh()
+            # Refresh the completed/total counts (event-driven, no polling needed).
+            update_completed_stats()
+            # Persist the change (debounced).
+            _schedule_save()
 
 # Helper function to calculate session duration
 def calculate_session_duration_str():
     """Calculates the total elapsed time since the first task was created."""
-    current_time = time.time()
-    if not todo_list:
+    if _session_start_time is None:
         total_duration_seconds = 0
     else:
-        # Find the creation time of the very first task added (index 2 in the tuple)
-        earliest_creation_time = min(task[2] for task in todo_list) 
-        total_duration_seconds = current_time - earliest_creation_time
-        
-    return str(timedelta(seconds=int(total_duration_seconds)))
+        # O(1): use the cached start time rather than scanning the task lists.
+        total_duration_seconds = int(time.time() - _session_start_time)
+
+    # Format H:MM:SS with plain integer math; this runs every second, so avoid
+    # allocating a timedelta object just for its repr.
+    hours, remainder = divmod(total_duration_seconds, 3600)
+    minutes, seconds = divmod(remainder, 60)
+    return f"{hours}:{minutes:02d}:{seconds:02d}"
             
 # Function to handle mouse wheel scrolling
 def on_mousewheel(event):
@@ -131,33 +273,60 @@ def on_mousewheel(event):
         canvas.yview_scroll(-1, "units")
     elif event.num == 5:
         canvas.yview_scroll(1, "units")
-
-def update_stats():
-    """Calculates completed task count and total elapsed session time, updating the stats label in real-time."""
-    global stats_label, root
-    
-    completed_count = 0
-    
-    # Find the count of completed tasks
-    for _, status, _, _ in todo_list:
-        if status:
-            completed_count += 1
-    
-    # --- Calculate Elapsed Session Time using helper ---
-    total_duration_str = calculate_session_duration_str()
-    
-    stats_text = (
-        f"Completed: {completed_count} / {len(todo_list)} | "
-        f"Elapsed Session Time: {total_duration_str}" # Renamed label for clarity
-    )
-    
-    # Update the label if it has been created
-    if stats_label:
+    # Materialize whichever rows just scrolled into view.
+    refresh_visible()
+
+def on_scrollbar(*args):
+    """Forwards scrollbar commands to the canvas and refreshes the visible rows."""
+    canvas.yview(*args)
+    refresh_visible()
+
+def on_canvas_configure(event):
+    """Re-evaluates the visible row slice after the canvas is resized."""
+    refresh_visible()
+
+# Cached pieces of the stats line. The completed portion changes only on
+# add/toggle/delete events; the elapsed portion changes at most once a second.
+_completed_text = "Completed: 0 / 0"
+_elapsed_text = "0:00:00"
+# The stats text currently shown on the label, so identical refreshes can be
+# dropped before they reach Tk (a config call forces a redraw even for the
+# same string).
+_last_stats_text = ""
+
+def _refresh_stats_label():
+    """Rebuilds the stats line from the two cached pieces and updates the label."""
+    global _last_stats_text
+    stats_text = f"{_completed_text} | Elapsed Session Time: {_elapsed_text}"
+    # Update the label if it has been created and the text actually changed.
+    if stats_label and stats_text != _last_stats_text:
+        _last_stats_text = stats_text
         stats_label.config(text=stats_text)
-        
+
+def update_completed_stats():
+    """Recounts completed tasks. Called only from add/toggle/delete events."""
+    global _completed_text
+
+    # Read the running counter maintained by toggle/delete - no list scan.
+    _completed_text = f"Completed: {_completed_count} / {len(descs)}"
+    _refresh_stats_label()
+
+def _tick_clock():
+    """Lightweight 1-second ticker for the elapsed-time display.
+
+    Unlike the old update_stats loop, this does not rescan the task lists; it only
+    reformats the duration and skips the Tk config call when the displayed
+    second has not changed."""
+    global _elapsed_text
+
+    new_text = calculate_session_duration_str()
+    if new_text != _elapsed_text:
+        _elapsed_text = new_text
+        _refresh_stats_label()
+
     # Re-schedule this function to run again in 1000 milliseconds (1 second)
     if root:
-        root.after(1000, update_stats) # Creates the real-time update loop
+        root.after(1000, _tick_clock) # Creates the real-time update loop
 
 
 # --- GUI Functions (Frontend Interface) ---
@@ -174,80 +343,203 @@ def set_list_name_gui():
 
 # Function called when the inner frame changes size (e.g., tasks are added/removed).
 def on_frame_configure(event):
-    """Adjusts the scroll region of the canvas to match the size of the inner frame."""
-    # Set the scroll region of the canvas to enclose the entire frame.
-    canvas.configure(scrollregion=canvas.bbox("all"))
+    """Adjusts the scroll region of the canvas when Tk relayouts the inner frame.
 
-# Function responsible for synchronizing the display with the todo_list data using Checkbuttons.
-def update_task_list_display():
-    """Destroys and recreates Checkbutton widgets for all tasks inside the scrollable frame."""
-    global current_theme
-    
-    # Destroy all existing widgets inside the task_frame (the inner container).
-    for widget in task_frame.winfo_children():
-        widget.destroy()
-
-    # Loop through every task in the backend list to create its corresponding widgets.
-    for index, (task, status, _, _) in enumerate(todo_list): # Unpack data structure including time (unused here)
-        # Create a variable to hold the state of the Checkbutton for the current task.
-        var = tk.BooleanVar(value=status)
-        
-        # Determine the text decoration (strikethrough) and colors based on the status.
-        font_config = ("Arial", 12)
-        
-        # --- VISUAL EFFECTS LOGIC ---
-        if status:
-            # If done, apply strikethrough, set text to dark gray, and set row background to pale gray.
-            font_config = ("Arial", 12, "overstrike") 
-            fg_color = current_theme['done_fg'] # Completed task text color
-            row_bg_color = current_theme['done_bg'] # Completed task background color
-        else:
-            # If pending, use normal font, default text color, and list background color.
-            fg_color = current_theme['default_fg'] 
-            row_bg_color = current_theme['list_bg'] 
-
-        # Create the Checkbutton widget.
-        chk = tk.Checkbutton(
+    Fires asynchronously after Tk finishes layout, so no update_idletasks
+    flush is ever needed; the region itself is the same analytic row_height *
+    task_count rectangle the refresh path uses (not a bbox walk)."""
+    canvas.configure(
+        scrollregion=(0, 0, canvas.winfo_width(), len(descs) * _get_row_height())
+    )
+
+# Helper to establish the uniform row height used for scroll geometry.
+def _get_row_height():
+    """Measures (once) and returns the fixed pixel height of a task row."""
+    global _row_height
+    if _row_height is None:
+        # Measure a sample row Label and add the vertical padding (2 * pady=5).
+        sample = tk.Label(task_frame, text=GLYPH_PENDING + "Sample", font=("Arial", 12))
+        _row_height = sample.winfo_reqheight() + 10
+        sample.destroy()
+    return _row_height
+
+# Rows kept materialized beyond each edge of the viewport, so small scroll
+# steps reuse already-bound rows instead of cycling widgets through the pool.
+_OVERSCAN = 3
+
+def _visible_range():
+    """Returns the [start, end) slice of task indices inside the canvas viewport."""
+    row_h = _get_row_height()
+    first = int(canvas.canvasy(0)) // row_h
+    start = max(0, first - _OVERSCAN)
+    # One extra row below the viewport so partially visible rows are covered,
+    # plus the overscan buffer.
+    end = first + canvas.winfo_height() // row_h + 2 + _OVERSCAN
+    return start, min(end, len(descs))
+
+# Checkbox glyphs prefixed to the row text; the status is rendered as part of
+# the label string, so no indicator widget state has to be kept in sync.
+GLYPH_DONE = "\u2611 "    # ballot box with check
+GLYPH_PENDING = "\u2610 " # empty ballot box
+
+# Helper function to apply text, colors and font to a single existing row.
+def _configure_row(index):
+    """Reconfigures the widgets of one row to match its task data."""
+    lbl, del_btn = live_rows[index]
+
+    # --- VISUAL EFFECTS LOGIC ---
+    # Look up the precomputed Tcl options for this status: strikethrough and
+    # muted colors when done, the theme defaults while pending.
+    status = statuses[index]
+    label_opts, row_bg = _resolved_styles[status]
+
+    # The checkbox is part of the text: a glyph prefix instead of an indicator.
+    glyph = GLYPH_DONE if status else GLYPH_PENDING
+    # Bypass the Tkinter wrapper for this hot path: tk.call skips the Python-
+    # level kwarg parsing and option post-processing of Misc.configure.
+    lbl.tk.call(lbl._w, 'configure', '-text', glyph + descs[index], *label_opts)
+    del_btn.tk.call(del_btn._w, 'configure', '-bg', row_bg)
+
+# Shared click handlers for every row. Each row widget carries its index in a
+# task_index attribute, so no per-row lambda/closure objects are needed.
+def _on_row_toggle(event):
+    """Toggles the task whose row label was clicked."""
+    toggle_task_status(event.widget.task_index)
+    return "break"
+
+def _on_row_delete(event):
+    """Deletes the task whose 'X' button was clicked."""
+    delete_task_logic(event.widget.task_index)
+    return "break"
+
+def _create_row(index):
+    """Acquires a pooled (or freshly built) widget pair and grids it at index."""
+    if _row_pool:
+        # Reuse a row that previously scrolled out of view.
+        lbl, del_btn = _row_pool.pop()
+    else:
+        # Pool empty: build a new row pair. A plain Label with a checkbox
+        # glyph is much cheaper than a full Checkbutton (no indicator bitmap,
+        # state machine or Tcl variable) and themes exactly the same way.
+        lbl = tk.Label(
             task_frame,
-            text=task,
-            variable=var, # Link the Checkbutton state to the BooleanVar.
-            # Use a lambda function to call the toggle_task_status with the task's index when clicked.
-            command=lambda i=index: toggle_task_status(i),
-            anchor='w', # Align the text to the west (left).
-            bg=row_bg_color, # Apply calculated background color
-            font=font_config,
-            fg=fg_color,
-            selectcolor=row_bg_color # Makes the checkbox background transparent (matches row color)
+            anchor='w' # Align the text to the west (left).
         )
-        # Place the checkbutton in the grid. Column 0, Row index. Span 2 columns.
-        chk.grid(row=index, column=0, sticky='ew', padx=10, pady=5)
+        # Route clicks to the shared handler (reads the task_index attribute).
+        lbl.bind("<Button-1>", _on_row_toggle)
 
         # Create the Delete Button widget next to the task.
         del_btn = tk.Button(
             task_frame,
             text="X", # Use 'X' for a compact delete button.
             fg='#800000', # Darker red/maroon for a softer delete look
-            bg=row_bg_color, # Apply calculated background color to delete button
             activebackground='#FFCCCC',
-            relief=tk.FLAT, # Flat look for calmness
-            # Use a lambda function to call the delete_task_logic with the task's index.
-            command=lambda i=index: delete_task_logic(i)
+            relief=tk.FLAT # Flat look for calmness
         )
-        # Place the delete button in the grid. Column 1, Row index.
-        del_btn.grid(row=index, column=1, padx=5, pady=5)
-
-        # Configure the grid to ensure the Checkbutton expands to fill the space.
-        task_frame.grid_columnconfigure(0, weight=1)
-
-    # After adding all widgets, update the scroll region of the canvas.
-    task_frame.update_idletasks() # Ensure the frame size is calculated.
-    canvas.config(scrollregion=canvas.bbox("all")) # Set the scrollable area.
+        # Same single-dispatch scheme for deletion.
+        del_btn.bind("<Button-1>", _on_row_delete)
+
+    # (Re)bind the pair to this row: update the dispatch index and grid position.
+    lbl.task_index = index
+    del_btn.task_index = index
+    # Place the row label in the grid. Column 0, Row index.
+    lbl.grid(row=index, column=0, sticky='ew', padx=10, pady=5)
+    # Place the delete button in the grid. Column 1, Row index.
+    del_btn.grid(row=index, column=1, padx=5, pady=5)
+
+    live_rows[index] = (lbl, del_btn)
+    # Apply the text and theme colors to the (re)acquired row.
+    _configure_row(index)
+
+def refresh_visible():
+    """Materializes widgets for the viewport rows and drops the off-screen ones.
+
+    This bounds the live widget count by the viewport height (a few dozen rows)
+    no matter how long the task list grows."""
+    start, end = _visible_range()
+
+    # Bind the module globals touched on every iteration to locals; global
+    # lookups in a tight loop cost real cycles.
+    rows = live_rows
+    pool = _row_pool
+    create_row = _create_row
+
+    # Release rows that scrolled out of the viewport or fell off the end of the
+    # list back into the pool (ungridded but alive) instead of destroying them.
+    for index in [i for i in rows if i < start or i >= end]:
+        lbl, del_btn = rows.pop(index)
+        lbl.grid_forget()
+        del_btn.grid_forget()
+        pool.append((lbl, del_btn))
+
+    # Create widgets for rows that just scrolled into view.
+    for index in range(start, end):
+        if index not in rows:
+            create_row(index)
+
+# Function responsible for synchronizing the display with the task data using row labels.
+# NOTE: a single ttk.Treeview was considered in place of the per-row widgets
+# (constant widget count regardless of task count), but it cannot reproduce the
+# per-row theme colors, fonts and flat delete buttons this UI relies on, so the
+# incremental per-row renderer is kept instead.
+def update_task_list_display(changed_index=None):
+    """Synchronizes the viewport row widgets with the task lists.
+
+    Only the rows inside the canvas viewport are materialized (see
+    refresh_visible). Passing changed_index patches just that single row
+    (O(1)); a full update re-syncs the viewport after adds and deletes."""
+    global _sized_rows
+
+    # Fast path: a single row changed (e.g. a checkbox toggle).
+    if changed_index is not None:
+        if changed_index in live_rows:
+            _configure_row(changed_index)
+        return
+
+    # Row-count-dependent geometry only needs recomputing when tasks were
+    # actually added or removed; toggles and recolors leave it untouched.
+    if _sized_rows != len(descs):
+        # Reserve (or release) fixed-height grid rows so the scroll geometry
+        # stays correct even though off-screen rows have no widgets behind them.
+        row_h = _get_row_height()
+        while _sized_rows < len(descs):
+            task_frame.grid_rowconfigure(_sized_rows, minsize=row_h)
+            _sized_rows += 1
+        while _sized_rows > len(descs):
+            _sized_rows -= 1
+            task_frame.grid_rowconfigure(_sized_rows, minsize=0)
+        # The scrollable area is known analytically (fixed row height x task
+        # count); no forced geometry flush or bbox("all") walk is needed.
+        canvas.config(scrollregion=(0, 0, canvas.winfo_width(), len(descs) * row_h))
+
+    # When several rows are about to be created (bulk add, first load), hide
+    # the embedded frame so Tk batches the grid work into one layout pass
+    # instead of recomputing geometry after every .grid() call.
+    start, end = _visible_range()
+    creating = sum(1 for i in range(start, end) if i not in live_rows)
+    batch_hide = creating > 1 and _canvas_window is not None
+    if batch_hide:
+        canvas.itemconfigure(_canvas_window, state='hidden')
+
+    # Materialize the viewport rows, then sync their contents (indices may
+    # have shifted after a delete). Bind the row configurator to a local
+    # before looping to avoid repeated global lookups.
+    refresh_visible()
+    configure_row = _configure_row
+    for index in live_rows:
+        configure_row(index)
+
+    if batch_hide:
+        canvas.itemconfigure(_canvas_window, state='normal')
 
 # --- Theme Switching Logic ---
 
 def apply_theme_colors():
     """Applies the colors from the global current_theme dictionary to all main widgets."""
-    
+
+    # Rebuild the resolved per-status row styles for the new theme.
+    _resolve_theme_styles()
+
     # Apply colors to the root and main structures
     root.config(bg=current_theme['main_bg'])
     title_frame.config(bg=current_theme['main_bg'])
@@ -266,8 +558,10 @@ def apply_theme_colors():
     canvas.config(background=current_theme['list_bg'])
     task_frame.config(background=current_theme['list_bg'])
     
-    # Re-render the task list to apply new colors to individual Checkbuttons/Delete buttons
-    update_task_list_display()
+    # Recolor the existing viewport rows in place. A theme change moves no
+    # rows, so the geometry/scrollregion work of a full refresh is skipped.
+    for index in live_rows:
+        _configure_row(index)
 
 def change_theme_selection(event):
     """Callback function for the Combobox to switch the theme."""
@@ -291,50 +585,64 @@ def change_theme_selection(event):
 
 # --- Custom Dialogs for Colored Input and Confirmation ---
 
+# Cached (x, y) center of the main window, computed once for dialog placement.
+_dialog_center = None
+
+def _get_dialog_center(parent):
+    """Returns the cached center point of the screen for dialog placement.
+
+    The app runs fullscreen, so the screen center and the window center are
+    the same point; winfo_screenwidth/height need no layout information, so
+    this never forces a geometry pass and works before the window is mapped."""
+    global _dialog_center
+    if _dialog_center is None:
+        _dialog_center = (
+            parent.winfo_screenwidth() // 2,
+            parent.winfo_screenheight() // 2,
+        )
+    return _dialog_center
+
 class CustomAskStringDialog(tk.Toplevel):
-    """Custom input dialog to allow background color customization."""
-    # ADD fg_color to constructor
-    def __init__(self, parent, title, prompt, bg_color, fg_color):
+    """Custom input dialog to allow background color customization.
+
+    Built once and reused: closing it only withdraws the window, and the next
+    custom_ask_string call re-themes and re-shows the same widget tree instead
+    of constructing a new Toplevel hierarchy per open."""
+
+    _instance = None # The shared dialog, created on first use
+
+    def __init__(self, parent):
         super().__init__(parent)
         self.transient(parent)
-        self.title(title)
         self.result = None
         self.parent = parent
-        self.bg_color = bg_color
-        self.fg_color = fg_color # Store fg_color
-        self.config(bg=self.bg_color)
-        
-        self.parent.update_idletasks()
-        w = self.winfo_reqwidth()
-        h = self.winfo_reqheight()
-        x = (self.parent.winfo_width() // 2) - (w // 2)
-        y = (self.parent.winfo_height() // 2) - (h // 2)
-        self.geometry('+%d+%d' % (x, y))
-
-        self.create_widgets(prompt)
+        # Reusable completion flag for wait_variable (set to 1 on ok/cancel).
+        self._done = tk.IntVar(master=self, value=0)
+
+        self.create_widgets()
         self.protocol("WM_DELETE_WINDOW", self.cancel)
-        self.grab_set()
-        self.wait_visibility() 
+        # Start hidden; show() maps the dialog when it is actually needed.
+        self.withdraw()
 
-    def create_widgets(self, prompt):
-        body = tk.Frame(self, bg=self.bg_color, padx=10, pady=10)
-        body.pack(padx=5, pady=5)
+    def create_widgets(self):
+        self.body = tk.Frame(self, padx=10, pady=10)
+        self.body.pack(padx=5, pady=5)
 
-        # USE self.fg_color for the prompt label
-        tk.Label(body, text=prompt, bg=self.bg_color, font=("Arial", 12), fg=self.fg_color).pack(pady=5)
+        # Prompt text and theme colors are filled in by reset() per open.
+        self.prompt_label = tk.Label(self.body, font=("Arial", 12))
+        self.prompt_label.pack(pady=5)
 
-        self.entry = tk.Entry(body, width=30, font=("Arial", 12))
+        self.entry = tk.Entry(self.body, width=30, font=("Arial", 12))
         self.entry.pack(pady=5)
-        self.entry.bind("<Return>", lambda event: self.ok())
-        self.entry.focus_set()
+        self.entry.bind("<Return>", self.ok)
 
-        button_frame = tk.Frame(self, bg=self.bg_color)
-        button_frame.pack(pady=5, padx=10)
+        self.button_frame = tk.Frame(self)
+        self.button_frame.pack(pady=5, padx=10)
 
         ok_button = tk.Button(
-            button_frame, 
-            text="Add", 
-            width=10, 
+            self.button_frame,
+            text="Add",
+            width=10,
             command=self.ok,
             bg='#CCCCE6', # Soft Lavender
             activebackground='#DDDDFF',
@@ -344,9 +652,9 @@ class CustomAskStringDialog(tk.Toplevel):
         ok_button.pack(side=tk.LEFT, padx=5)
 
         cancel_button = tk.Button(
-            button_frame, 
-            text="Cancel", 
-            width=10, 
+            self.button_frame,
+            text="Cancel",
+            width=10,
             command=self.cancel,
             bg='#FFCCCC', # Soft Red
             activebackground='#FF9999',
@@ -355,99 +663,165 @@ class CustomAskStringDialog(tk.Toplevel):
         )
         cancel_button.pack(side=tk.LEFT, padx=5)
 
-    def ok(self):
+    def reset(self, title, prompt, bg_color, fg_color):
+        """Re-themes the shared dialog and clears the previous input."""
+        self.title(title)
+        self.config(bg=bg_color)
+        self.body.config(bg=bg_color)
+        self.button_frame.config(bg=bg_color)
+        self.prompt_label.config(text=prompt, bg=bg_color, fg=fg_color)
+        self.entry.delete(0, tk.END)
+        self.result = None
+
+    def show(self):
+        """Centers, maps and modally runs the dialog; returns the result."""
+        cx, cy = _get_dialog_center(self.parent)
+        # Deterministic size: avoids querying the requested size per open.
+        w = 340
+        h = 170
+        self.geometry(f'{w}x{h}+{cx - w // 2}+{cy - h // 2}')
+
+        self._done.set(0)
+        self.deiconify()
+        self.wait_visibility()
+        self.grab_set()
+        self.entry.focus_set()
+        # Block until ok/cancel hides the dialog again (no destroy, no rebuild).
+        self.wait_variable(self._done)
+        return self.result
+
+    def ok(self, event=None):
         self.result = self.entry.get()
-        self.destroy()
+        self._close()
 
     def cancel(self):
-        self.result = None 
-        self.destroy()
+        self.result = None
+        self._close()
+
+    def _close(self):
+        """Hides the dialog for later reuse and releases the modal grab."""
+        self.grab_release()
+        self.withdraw()
+        self._done.set(1)
 
 def custom_ask_string(parent, title, prompt):
-    """Utility function to create and run the custom dialog, passing the current theme color."""
+    """Utility function to run the shared input dialog with the current theme colors."""
+    dialog = CustomAskStringDialog._instance
+    if dialog is None:
+        # First use: build the dialog once; later opens only re-show it.
+        dialog = CustomAskStringDialog._instance = CustomAskStringDialog(parent)
     # PASSES CURRENT THEME BG AND FG COLOR
-    dialog = CustomAskStringDialog(parent, title, prompt, 
-                                   bg_color=current_theme['main_bg'], 
-                                   fg_color=current_theme['title_fg']) 
-    parent.wait_window(dialog)
-    return dialog.result
+    dialog.reset(title, prompt,
+                 bg_color=current_theme['main_bg'],
+                 fg_color=current_theme['title_fg'])
+    return dialog.show()
 
 class CustomAskYesNoDialog(tk.Toplevel):
-    """Custom Yes/No confirmation dialog with colored background."""
-    # ADD fg_color to constructor
-    def __init__(self, parent, title, message, bg_color, fg_color, button_texts=("Yes, Exit", "Cancel")):
+    """Custom Yes/No confirmation dialog with colored background.
+
+    Like CustomAskStringDialog, a single instance is built on first use and
+    re-themed/re-shown for every later confirmation."""
+
+    _instance = None # The shared dialog, created on first use
+
+    def __init__(self, parent):
         super().__init__(parent)
         self.transient(parent)
-        self.title(title)
         self.result = False
         self.parent = parent
-        self.bg_color = bg_color
-        self.fg_color = fg_color # Store fg_color
-        self.button_texts = button_texts # Store custom button texts
-        self.config(bg=self.bg_color)
-        
-        self.parent.update_idletasks()
-        w = 400
-        h = 200
-        x = (self.parent.winfo_width() // 2) - (w // 2)
-        y = (self.parent.winfo_height() // 2) - (h // 2)
-        self.geometry(f'{w}x{h}+{x}+{y}')
+        # Reusable completion flag for wait_variable (set to 1 on yes/no).
+        self._done = tk.IntVar(master=self, value=0)
 
-        self.create_widgets(message)
+        self.create_widgets()
         self.protocol("WM_DELETE_WINDOW", self.no_action)
-        self.grab_set()
-        self.parent.wait_window(self)
+        # Start hidden; show() maps the dialog when it is actually needed.
+        self.withdraw()
 
-    def create_widgets(self, message):
-        body = tk.Frame(self, bg=self.bg_color, padx=10, pady=15)
-        body.pack(padx=5, pady=5, fill='both', expand=True)
+    def create_widgets(self):
+        self.body = tk.Frame(self, padx=10, pady=15)
+        self.body.pack(padx=5, pady=5, fill='both', expand=True)
 
-        # USE self.fg_color for the message label
-        tk.Label(body, text=message, bg=self.bg_color, font=("Arial", 12), fg=self.fg_color, justify=tk.LEFT).pack(pady=10, fill='x')
+        # Message text and theme colors are filled in by reset() per open.
+        self.message_label = tk.Label(self.body, font=("Arial", 12), justify=tk.LEFT)
+        self.message_label.pack(pady=10, fill='x')
 
-        button_frame = tk.Frame(self, bg=self.bg_color)
-        button_frame.pack(pady=5, padx=10)
+        self.button_frame = tk.Frame(self)
+        self.button_frame.pack(pady=5, padx=10)
 
-        yes_button = tk.Button(
-            button_frame, 
-            text=self.button_texts[0], # Use custom text for YES button
-            width=15, 
+        self.yes_button = tk.Button(
+            self.button_frame,
+            width=15,
             command=self.yes_action,
-            bg='#FFCCCC', 
+            bg='#FFCCCC',
             activebackground='#FF9999',
             fg='#800000',
             relief=tk.GROOVE
         )
-        yes_button.pack(side=tk.LEFT, padx=5)
+        self.yes_button.pack(side=tk.LEFT, padx=5)
 
-        no_button = tk.Button(
-            button_frame, 
-            text=self.button_texts[1], # Use custom text for NO button
-            width=15, 
+        self.no_button = tk.Button(
+            self.button_frame,
+            width=15,
             command=self.no_action,
-            bg='#CCDDDD', 
+            bg='#CCDDDD',
             activebackground='#DDFFFF',
             fg='#003333',
             relief=tk.GROOVE
         )
-        no_button.pack(side=tk.LEFT, padx=5)
-        
+        self.no_button.pack(side=tk.LEFT, padx=5)
+
+    def reset(self, title, message, bg_color, fg_color, button_texts):
+        """Re-themes the shared dialog and installs the per-call texts."""
+        self.title(title)
+        self.config(bg=bg_color)
+        self.body.config(bg=bg_color)
+        self.button_frame.config(bg=bg_color)
+        self.message_label.config(text=message, bg=bg_color, fg=fg_color)
+        self.yes_button.config(text=button_texts[0]) # Use custom text for YES button
+        self.no_button.config(text=button_texts[1]) # Use custom text for NO button
+        self.result = False
+
+    def show(self):
+        """Centers, maps and modally runs the dialog; returns the result."""
+        cx, cy = _get_dialog_center(self.parent)
+        w = 400
+        h = 200
+        self.geometry(f'{w}x{h}+{cx - w // 2}+{cy - h // 2}')
+
+        self._done.set(0)
+        self.deiconify()
+        self.wait_visibility()
+        self.grab_set()
+        # Block until yes/no hides the dialog again (no destroy, no rebuild).
+        self.wait_variable(self._done)
+        return self.result
+
     def yes_action(self):
         self.result = True
-        self.destroy()
+        self._close()
 
     def no_action(self):
         self.result = False
-        self.destroy()
+        self._close()
+
+    def _close(self):
+        """Hides the dialog for later reuse and releases the modal grab."""
+        self.grab_release()
+        self.withdraw()
+        self._done.set(1)
 
 def custom_ask_yes_no(parent, title, message, button_texts=("Yes, Delete", "No, Keep It")):
-    """Utility function to create and run the custom yes/no dialog, passing the current theme color."""
+    """Utility function to run the shared yes/no dialog with the current theme colors."""
+    dialog = CustomAskYesNoDialog._instance
+    if dialog is None:
+        # First use: build the dialog once; later opens only re-show it.
+        dialog = CustomAskYesNoDialog._instance = CustomAskYesNoDialog(parent)
     # PASSES CURRENT THEME BG AND FG COLOR
-    dialog = CustomAskYesNoDialog(parent, title, message, 
-                                  bg_color=current_theme['main_bg'], 
-                                  fg_color=current_theme['title_fg'],
-                                  button_texts=button_texts) 
-    return dialog.result
+    dialog.reset(title, message,
+                 bg_color=current_theme['main_bg'],
+                 fg_color=current_theme['title_fg'],
+                 button_texts=button_texts)
+    return dialog.show()
 
 def show_add_task_dialog():
     """Opens a custom colored dialog for task input and handles addition."""
@@ -482,6 +856,8 @@ def show_exit_summary():
         summary_message,
         button_texts=("Yes, End Session", "Cancel")
     ):
+        # Flush any pending debounced save so no edits are lost on exit.
+        _save_tasks()
         # If the user clicks 'Yes, End Session', destroy the main window
         root.destroy()
 
@@ -596,10 +972,14 @@ def main():
 
     # Create the Canvas widget.
     canvas = tk.Canvas(root, borderwidth=0) 
-    # Create the vertical scrollbar.
-    scrollbar = ttk.Scrollbar(root, orient="vertical", command=canvas.yview)
+    # Create the vertical scrollbar. Scrollbar commands go through on_scrollbar
+    # so dragging it also refreshes the virtualized rows.
+    scrollbar = ttk.Scrollbar(root, orient="vertical", command=on_scrollbar)
     # Place the inner frame (task_frame) inside the canvas view.
-    task_frame = tk.Frame(canvas) 
+    task_frame = tk.Frame(canvas)
+    # Configure the grid once so the row labels expand to fill the space
+    # (a frame-level property, not a per-row one).
+    task_frame.grid_columnconfigure(0, weight=1)
 
     # Configure the canvas to use the scrollbar for the y-axis.
     canvas.configure(yscrollcommand=scrollbar.set)
@@ -614,11 +994,16 @@ def main():
     root.grid_columnconfigure(1, weight=0) 
 
 
-    # Create a window inside the canvas to hold the task_frame.
-    canvas.create_window((0, 0), window=task_frame, anchor="nw")
+    # Create a window inside the canvas to hold the task_frame. Keep the item
+    # id so batch updates can temporarily hide the frame.
+    global _canvas_window
+    _canvas_window = canvas.create_window((0, 0), window=task_frame, anchor="nw")
     # Bind the frame configuration event to adjust the canvas scroll region when the frame size changes.
     task_frame.bind("<Configure>", on_frame_configure)
     
+    # Re-evaluate which rows are visible whenever the canvas itself resizes.
+    canvas.bind("<Configure>", on_canvas_configure)
+
     # Bind mouse wheel events to the canvas
     canvas.bind_all("<MouseWheel>", on_mousewheel)  # Windows/macOS
     canvas.bind_all("<Button-4>", on_mousewheel)    # Linux scroll up
@@ -641,13 +1026,17 @@ def main():
     root.bind("<F11>", lambda event: root.attributes("-fullscreen", not root.attributes("-fullscreen")))
 
     # --- INITIAL SETUP & RUN ---
-    
+
+    # Restore the tasks saved by the previous session (if any).
+    _load_tasks()
+
     # Apply the initial default theme colors to all widgets
-    apply_theme_colors() 
+    apply_theme_colors()
     
     # Call the update function once to populate the list upon startup.
     update_task_list_display()
-    update_stats() # New: Call update_stats initially, which starts the root.after loop
+    update_completed_stats() # Populate the completed counts once at startup
+    _tick_clock() # Start the lightweight 1-second elapsed-time ticker
     
     # Start the event loop, which listens for user actions.
     root.mainloop()